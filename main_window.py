@@ -13,8 +13,8 @@ import logging
 from typing import List, Optional
 from pathlib import Path
 
-from model_handler import ModelHandler, PredictionWorker
-from ui_components import ImageCard
+from model_handler import ModelHandler, InferenceService
+from ui_components import ImageCard, StyleSheet
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,8 +29,9 @@ class DentalXRayAnalyzer(QMainWindow):
         self.setMinimumSize(1200, 800)
         
         # Initialize state
-        self.workers: List[PredictionWorker] = []
         self.model_handler: Optional[ModelHandler] = None
+        self.service: Optional[InferenceService] = None
+        self._cards: List[ImageCard] = []
         
         try:
             self.init_model()
@@ -46,6 +47,10 @@ class DentalXRayAnalyzer(QMainWindow):
         try:
             model_path = os.path.join(os.path.dirname(__file__), 'initial_model.pth')
             self.model_handler = ModelHandler(model_path)
+            self.service = InferenceService(self.model_handler)
+            self.service.prediction_ready.connect(self._handle_prediction_result)
+            self.service.error.connect(self._handle_prediction_error)
+            self.service.start()
         except Exception as e:
             logger.error(f"Model initialization failed: {str(e)}")
             raise
@@ -78,31 +83,20 @@ class DentalXRayAnalyzer(QMainWindow):
 
         # Logo
         logo = QLabel("🦷")
-        logo.setStyleSheet("font-size: 32px;")
+        logo.setProperty("role", "logo")
         
         # Title and subtitle
         title_container = QWidget()
         title_layout = QVBoxLayout(title_container)
         
         title = QLabel("DentAI Pro")
-        title.setStyleSheet("""
-            font-size: 32px;
-            font-weight: bold;
-            color: #2c3e50;
-        """)
+        title.setProperty("role", "title")
         
         subtitle = QLabel("Advanced Dental Radiograph Analysis System")
-        subtitle.setStyleSheet("""
-            font-size: 18px;
-            color: #34495e;
-        """)
+        subtitle.setProperty("role", "subtitle")
         
         description = QLabel("Powered by AI for accurate dental pathology detection")
-        description.setStyleSheet("""
-            font-size: 14px;
-            color: #7f8c8d;
-            font-style: italic;
-        """)
+        description.setProperty("role", "description")
         
         title_layout.addWidget(title)
         title_layout.addWidget(subtitle)
@@ -117,13 +111,7 @@ class DentalXRayAnalyzer(QMainWindow):
     def _create_control_panel(self) -> QWidget:
         """Create control panel with action buttons."""
         panel = QWidget()
-        panel.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        panel.setProperty("role", "controlPanel")
         
         layout = QHBoxLayout(panel)
         layout.setSpacing(15)
@@ -142,21 +130,7 @@ class DentalXRayAnalyzer(QMainWindow):
     def _create_button(self, text: str, slot: callable) -> QPushButton:
         """Create styled button with connection to slot."""
         btn = QPushButton(text)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #2472a4;
-            }
-        """)
+        btn.setProperty("role", "action")
         btn.clicked.connect(slot)
         return btn
 
@@ -164,40 +138,29 @@ class DentalXRayAnalyzer(QMainWindow):
         """Create progress bar for batch processing."""
         progress_bar = QProgressBar()
         progress_bar.setVisible(False)
-        progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                text-align: center;
-                height: 25px;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                border-radius: 3px;
-            }
-        """)
+        progress_bar.setProperty("role", "batch")
         return progress_bar
 
     def _create_scroll_area(self) -> QScrollArea:
         """Create scrollable area for image cards."""
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #f5f6fa;
-            }
-        """)
-        
-        self.grid_widget = QWidget()
-        self.grid_layout = QHBoxLayout(self.grid_widget)
-        self.grid_layout.setSpacing(20)
-        self.grid_layout.setContentsMargins(20, 20, 20, 20)
-        self.grid_layout.addStretch()
+        scroll.setProperty("role", "cards")
         
+        self.scroll = scroll
+        self.grid_widget, self.grid_layout = self._create_grid()
         scroll.setWidget(self.grid_widget)
         return scroll
 
+    def _create_grid(self):
+        """Create the widget and layout holding the image cards."""
+        grid_widget = QWidget()
+        grid_layout = QHBoxLayout(grid_widget)
+        grid_layout.setSpacing(20)
+        grid_layout.setContentsMargins(20, 20, 20, 20)
+        grid_layout.addStretch()
+        return grid_widget, grid_layout
+
     def load_images(self):
         """Load and process dental X-ray images."""
         try:
@@ -211,67 +174,61 @@ class DentalXRayAnalyzer(QMainWindow):
             if not file_names:
                 return
                 
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setMaximum(len(file_names))
-            self.progress_bar.setValue(0)
+            if self.progress_bar.isVisible():
+                # Previous images are still in flight; extend the running count
+                self.progress_bar.setMaximum(self.progress_bar.maximum() + len(file_names))
+            else:
+                self.progress_bar.setMaximum(len(file_names))
+                self.progress_bar.setValue(0)
+                self.progress_bar.setVisible(True)
             
             for file_name in file_names:
-                self._process_image(file_name)
+                self.service.submit(file_name)
                 
         except Exception as e:
             logger.error(f"Error loading images: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to load images: {str(e)}")
 
-    def _process_image(self, image_path: str):
-        """Process single image with prediction worker."""
-        try:
-            worker = PredictionWorker(self.model_handler, image_path)
-            worker.finished.connect(self._handle_prediction_result)
-            worker.error.connect(self._handle_prediction_error)
-            self.workers.append(worker)
-            worker.start()
-        except Exception as e:
-            logger.error(f"Error processing image {image_path}: {str(e)}")
-            self._handle_prediction_error(str(e))
-
-    def _handle_prediction_result(self, predictions: list, image_path: str):
+    def _handle_prediction_result(self, slot: int):
         """Handle successful prediction result."""
         try:
+            image_path, predictions = self.service.take_result(slot)
             card = ImageCard(image_path, predictions)
             self.grid_layout.insertWidget(self.grid_layout.count() - 1, card)
-            
-            self.progress_bar.setValue(self.progress_bar.value() + 1)
-            if self.progress_bar.value() == self.progress_bar.maximum():
-                self.progress_bar.setVisible(False)
-                self._cleanup_workers()
+            self._cards.append(card)
         except Exception as e:
             logger.error(f"Error handling prediction result: {str(e)}")
             self._handle_prediction_error(str(e))
+        finally:
+            self._advance_progress()
+
+    def _advance_progress(self):
+        """Count one processed image and hide the progress bar when done."""
+        self.progress_bar.setValue(self.progress_bar.value() + 1)
+        if self.progress_bar.value() == self.progress_bar.maximum():
+            self.progress_bar.setVisible(False)
 
     def _handle_prediction_error(self, error_message: str):
         """Handle prediction error."""
         QMessageBox.warning(self, "Prediction Error", 
                           f"Error processing image: {error_message}")
-        self.progress_bar.setValue(self.progress_bar.value() + 1)
-
-    def _cleanup_workers(self):
-        """Clean up finished worker threads."""
-        self.workers = [w for w in self.workers if not w.isFinished()]
 
     def clear_images(self):
         """Clear all image cards."""
         try:
-            while self.grid_layout.count() > 1:  # Keep the stretch item
-                item = self.grid_layout.takeAt(0)
-                if widget := item.widget():
-                    widget.deleteLater()
+            # Swap in an empty grid so Qt disposes of all cards in one deletion
+            old_grid = self.scroll.takeWidget()
+            self.grid_widget, self.grid_layout = self._create_grid()
+            self.scroll.setWidget(self.grid_widget)
+            old_grid.deleteLater()
+            self._cards.clear()
         except Exception as e:
             logger.error(f"Error clearing images: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to clear images: {str(e)}")
 
     def export_report(self):
         """Export analysis results to PDF."""
-        if self.grid_layout.count() <= 1:  # Only stretch item
+        if not self._cards:
             QMessageBox.warning(self, "Warning", "No images to export!")
             return
             
@@ -298,12 +255,7 @@ class DentalXRayAnalyzer(QMainWindow):
             from report_generator import ReportGenerator, prepare_case_data
             
             # Collect all cases
-            cases = []
-            for i in range(self.grid_layout.count() - 1):  # -1 to exclude stretch item
-                widget = self.grid_layout.itemAt(i).widget()
-                if isinstance(widget, ImageCard):
-                    case_data = prepare_case_data(widget)
-                    cases.append(case_data)
+            cases = [prepare_case_data(card) for card in self._cards]
             
             if not cases:
                 raise ValueError("No cases to export")
@@ -319,8 +271,8 @@ class DentalXRayAnalyzer(QMainWindow):
     def closeEvent(self, event):
         """Handle application closure."""
         try:
-            for worker in self.workers:
-                worker.wait()
+            if self.service is not None:
+                self.service.stop()
             super().closeEvent(event)
         except Exception as e:
             logger.error(f"Error during closure: {str(e)}")
@@ -331,12 +283,8 @@ def main():
         app = QApplication(sys.argv)
         app.setStyle('Fusion')
         
-        # Set app-wide stylesheet
-        app.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f6fa;
-            }
-        """)
+        # Set app-wide stylesheet; widgets select their rules by role
+        app.setStyleSheet(StyleSheet.APPLICATION)
         
         window = DentalXRayAnalyzer()
         window.show()
@@ -3,26 +3,63 @@ Handles all model-related operations and predictions for the dental X-ray analyz
 """
 
 import os
+import contextlib
+import glob
+import itertools
+import warnings
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import torch
 import torch.nn.functional as F
 from torchvision import models
+from torchvision.io import read_file, decode_jpeg, ImageReadMode
 import numpy as np
 from PIL import Image
-import albumentations as A
-from albumentations.pytorch import ToTensorV2
 from PyQt6.QtCore import QThread, pyqtSignal
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of images stacked into a single forward pass
+BATCH_SIZE = 16
+
+# Model input resolution and ImageNet normalization constants
+INPUT_SIZE = (224, 224)
+MEAN = [0.485, 0.456, 0.406]
+STD = [0.229, 0.224, 0.225]
+
+# Non-tensor globals in the checkpoint pickle: val_acc is saved as a numpy.float64.
+# numpy 2 moved numpy.core to numpy._core, so the pickled name needs an alias there,
+# which torch's weights-only allowlist accepts from 2.6 on.
+if np.lib.NumpyVersion(np.__version__) >= '2.0.0':
+    from numpy._core.multiarray import scalar as _numpy_scalar
+    _CHECKPOINT_SCALAR = (_numpy_scalar, "numpy.core.multiarray.scalar")
+    SAFE_GLOBALS_MIN_TORCH = (2, 6)
+else:
+    from numpy.core.multiarray import scalar as _CHECKPOINT_SCALAR
+    SAFE_GLOBALS_MIN_TORCH = (2, 5)
+CHECKPOINT_NUMPY_GLOBALS = [_CHECKPOINT_SCALAR, np.dtype, type(np.dtype('f8'))]
+
+@contextlib.contextmanager
+def _torchscript_warnings_silenced():
+    """Silence the FutureWarning that newer torch emits on every TorchScript call."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        yield
+
 class ModelHandler:
     """Handles model loading, configuration and inference."""
     
     def __init__(self, model_path: str = 'initial_model.pth'):
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        # Half-precision weights on CUDA; CPU keeps FP32 weights
+        self.dtype = torch.float16 if self.device.type == 'cuda' else torch.float32
+        # Autocast dtype, or None to run in plain FP32
+        self.autocast_dtype = self._select_autocast_dtype()
         self.model_path = model_path
         self.class_names = [
             'Nil control', 
@@ -35,93 +72,328 @@ class ModelHandler:
             'radicular cyst'
         ]
         
-        self.transform = A.Compose([
-            A.Resize(224, 224),
-            A.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
-            ToTensorV2()
-        ])
+        # Normalization constants, materialized once on the host and on the model device
+        self._host_mean = torch.tensor(MEAN).view(1, 3, 1, 1)
+        self._host_inv_std = (1.0 / torch.tensor(STD)).view(1, 3, 1, 1)
+        self._mean = self._host_mean.to(self.device)
+        self._inv_std = self._host_inv_std.to(self.device)
         
         self.model = self._initialize_model()
+        
+        # Forward pass for a full BATCH_SIZE batch, captured once as a CUDA graph
+        self._graph: Optional[torch.cuda.CUDAGraph] = None
+        if self.device.type == 'cuda':
+            self._capture_cuda_graph()
+
+    def _select_autocast_dtype(self) -> Optional[torch.dtype]:
+        """FP16 on CUDA; BF16 on CPU only where oneDNN runs it natively."""
+        if self.device.type == 'cuda':
+            return torch.float16
+        try:
+            # Without AVX512-BF16/AMX oneDNN emulates BF16, which is slower than FP32
+            if torch.ops.mkldnn._is_mkldnn_bf16_supported():
+                return torch.bfloat16
+        except (AttributeError, RuntimeError):
+            pass
+        return None
 
     def _initialize_model(self) -> torch.nn.Module:
         """Initialize and load the model."""
+        # Input shape is fixed, so let cuDNN autotune once and allow TF32 math
+        torch.backends.cudnn.benchmark = True
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.set_float32_matmul_precision('high')
+        # Inference only; grad mode is per-thread, so predict_batch also uses inference_mode
+        torch.set_grad_enabled(False)
+        
         try:
+            if not os.path.exists(self.model_path):
+                raise FileNotFoundError(f"Model file '{self.model_path}' not found!")
+            
+            cache_path = self._traced_model_path()
+            if os.path.exists(cache_path):
+                try:
+                    with _torchscript_warnings_silenced():
+                        return torch.jit.load(cache_path, map_location=self.device)
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable traced model {cache_path}: {str(e)}")
+            
             model = models.efficientnet_b0(weights=None)
             model.classifier = torch.nn.Sequential(
                 torch.nn.Dropout(p=0.2),
                 torch.nn.Linear(1280, len(self.class_names))  # Fixed output size to match classes
             )
-            
-            if not os.path.exists(self.model_path):
-                raise FileNotFoundError(f"Model file '{self.model_path}' not found!")
                 
-            checkpoint = torch.load(self.model_path, map_location=self.device)
+            checkpoint = self._load_checkpoint()
             
             if 'model_state_dict' in checkpoint:
-                model.load_state_dict(checkpoint['model_state_dict'], strict=True)
+                model.load_state_dict(checkpoint['model_state_dict'], strict=True, assign=True)
             else:
                 raise KeyError("Invalid checkpoint format")
             
-            model = model.to(self.device)
+            model = model.to(self.device, dtype=self.dtype)
             model.eval()
-            return model
+            return self._trace_model(model, cache_path)
             
         except Exception as e:
             logger.error(f"Failed to initialize model: {str(e)}")
             raise
 
+    def _load_checkpoint(self) -> Dict:
+        """Memory-map the checkpoint so only the pages read by load_state_dict are touched."""
+        if torch.__version__ < SAFE_GLOBALS_MIN_TORCH:
+            # Older torch cannot allowlist the numpy scalar stored as val_acc,
+            # so the bundled checkpoint is loaded fully
+            return torch.load(self.model_path, map_location='cpu', mmap=True, weights_only=False)
+        with torch.serialization.safe_globals(CHECKPOINT_NUMPY_GLOBALS):
+            return torch.load(self.model_path, map_location='cpu', mmap=True, weights_only=True)
+
+    def _traced_model_path(self) -> str:
+        """Path of the TorchScript cache for the checkpoint, device, precision and torch version."""
+        stem = os.path.splitext(self.model_path)[0]
+        mtime = int(os.path.getmtime(self.model_path))
+        precision = str(self.autocast_dtype or self.dtype).split('.')[-1]
+        return f"{stem}.{self.device.type}.{precision}.torch{torch.__version__}.{mtime}.torchscript"
+
+    def _trace_model(self, model: torch.nn.Module, cache_path: str) -> torch.nn.Module:
+        """Compile the eager model to an optimized TorchScript graph and cache it on disk."""
+        try:
+            example = torch.zeros(1, 3, *INPUT_SIZE, device=self.device, dtype=self.dtype)
+            # Trace under the same autocast policy used at inference time
+            with torch.no_grad(), self._autocast(), _torchscript_warnings_silenced():
+                traced = torch.jit.trace(model, example)
+                traced = torch.jit.optimize_for_inference(traced)
+        except Exception as e:
+            logger.warning(f"TorchScript tracing failed, using eager model: {str(e)}")
+            return model
+        
+        try:
+            with _torchscript_warnings_silenced():
+                torch.jit.save(traced, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not cache traced model to {cache_path}: {str(e)}")
+        else:
+            self._remove_stale_traces(cache_path)
+        return traced
+
+    def _remove_stale_traces(self, cache_path: str):
+        """Delete TorchScript caches of this checkpoint other than cache_path."""
+        stem = glob.escape(os.path.splitext(self.model_path)[0])
+        stale = glob.glob(f"{stem}.cpu.*.torchscript") + glob.glob(f"{stem}.cuda.*.torchscript")
+        for path in stale:
+            if os.path.abspath(path) == os.path.abspath(cache_path):
+                continue
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove stale traced model {path}: {str(e)}")
+
+    def _capture_cuda_graph(self):
+        """Capture the model forward for a fixed-shape batch so predictions replay it."""
+        try:
+            self._static_input = torch.zeros(BATCH_SIZE, 3, *INPUT_SIZE, device=self.device, dtype=self.dtype)
+            
+            # Warm up on a side stream so lazy initialization happens outside the capture
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream), torch.inference_mode(), self._autocast():
+                for _ in range(3):
+                    self.model(self._static_input)
+            torch.cuda.current_stream().wait_stream(stream)
+            
+            graph = torch.cuda.CUDAGraph()
+            with torch.inference_mode(), self._autocast(), torch.cuda.graph(graph):
+                self._static_output = self.model(self._static_input).float()
+            self._graph = graph
+        except Exception as e:
+            logger.warning(f"CUDA graph capture failed, running model directly: {str(e)}")
+            self._graph = None
+
     def preprocess_image(self, image_path: str) -> Optional[torch.Tensor]:
         """Preprocess image for model input."""
+        try:
+            return self._decode_on_device(image_path)
+        except Exception as e:
+            logger.debug(f"Device decode failed for {image_path}, falling back to PIL: {str(e)}")
+        
         try:
             image = Image.open(image_path).convert('RGB')
-            image_array = np.array(image)
-            transformed = self.transform(image=image_array)
-            return transformed['image'].unsqueeze(0).to(self.device)
+            image_tensor = torch.from_numpy(np.array(image)).permute(2, 0, 1)
+            # Left on the host; predict_batch uploads it with the rest of the batch
+            return self._fast_transform(image_tensor)
         except Exception as e:
             logger.error(f"Error preprocessing image {image_path}: {str(e)}")
             return None
 
-    @torch.no_grad()
+    def _decode_on_device(self, image_path: str) -> torch.Tensor:
+        """Decode a JPEG directly on the model device and normalize it there."""
+        data = read_file(image_path)
+        image = decode_jpeg(data, mode=ImageReadMode.RGB, device=self.device)
+        return self._fast_transform(image)
+
+    def _fast_transform(self, image: torch.Tensor) -> torch.Tensor:
+        """Resize and normalize a uint8 CHW RGB tensor into a model input on its own device."""
+        if image.device.type == self.device.type:
+            mean, inv_std = self._mean, self._inv_std
+        else:
+            mean, inv_std = self._host_mean, self._host_inv_std
+        image = image.unsqueeze(0).float().mul_(1.0 / 255.0)
+        image = F.interpolate(image, size=INPUT_SIZE, mode='bilinear', antialias=True, align_corners=False)
+        return (image - mean) * inv_std
+
     def predict(self, image_tensor: torch.Tensor, top_k: int = 3) -> List[Tuple[str, float]]:
         """Make prediction with confidence scores."""
+        return self.predict_batch([image_tensor], top_k)[0]
+
+    def predict_batch(self, tensors: List[torch.Tensor], top_k: int = 3) -> List[List[Tuple[str, float]]]:
+        """Make predictions for several preprocessed images in one forward pass."""
         try:
-            outputs = self.model(image_tensor)
-            probabilities = F.softmax(outputs, dim=1)
-            confidences, predictions = torch.topk(probabilities, top_k)
+            with torch.inference_mode(), self._autocast():
+                batch = torch.cat([tensor.to(self.device) for tensor in tensors], 0).to(dtype=self.dtype)
+                # Softmax in FP32 to keep class probabilities precise
+                outputs = self._forward(batch)
+                probabilities = F.softmax(outputs, dim=1)
+                confidences, predictions = torch.topk(probabilities, top_k, dim=1)
             
             results = []
-            for pred, conf in zip(predictions[0], confidences[0]):
-                results.append((self.class_names[pred.item()], conf.item()))
+            for preds, confs in zip(predictions.tolist(), confidences.tolist()):
+                results.append([(self.class_names[pred], conf) for pred, conf in zip(preds, confs)])
             return results
             
         except Exception as e:
             logger.error(f"Error during prediction: {str(e)}")
-            return [("Error", 0.0)]
+            return [[("Error", 0.0)] for _ in tensors]
 
-class PredictionWorker(QThread):
-    """Worker thread for handling predictions."""
+    def _forward(self, batch: torch.Tensor) -> torch.Tensor:
+        """Run the model, replaying the captured CUDA graph when the batch fits it."""
+        num_images = batch.shape[0]
+        if self._graph is None or num_images > BATCH_SIZE:
+            return self.model(batch).float()
+        
+        # Rows past num_images keep stale inputs; eval-mode rows are independent
+        self._static_input[:num_images].copy_(batch)
+        self._graph.replay()
+        return self._static_output[:num_images].clone()
+
+    def _autocast(self) -> torch.autocast:
+        """Mixed-precision context for the selected autocast dtype; a no-op for FP32."""
+        if self.autocast_dtype is None:
+            return torch.autocast(self.device.type, enabled=False)
+        # Weight-cast caching is incompatible with CUDA graph capture
+        return torch.autocast(self.device.type, dtype=self.autocast_dtype, cache_enabled=False)
+
+class FastQueue:
+    """Unbounded FIFO that hands out queued items in batches."""
     
-    finished = pyqtSignal(list, str)
-    progress = pyqtSignal(int)
+    def __init__(self):
+        self.dq = deque()
+        self.cv = threading.Condition()
+
+    def put(self, item):
+        """Append an item and wake a waiting consumer."""
+        with self.cv:
+            self.dq.append(item)
+            self.cv.notify()
+
+    def get_batch(self, max_n: int, block: bool = True) -> list:
+        """Return up to max_n items, waiting for the first one unless block is False."""
+        with self.cv:
+            while block and not self.dq:
+                self.cv.wait()
+            return [self.dq.popleft() for _ in range(min(max_n, len(self.dq)))]
+
+class InferenceService(QThread):
+    """Persistent worker thread that runs queued images through the model in batches."""
+    
+    # Carries a result slot id; the receiver reads the result via take_result
+    prediction_ready = pyqtSignal(int)
     error = pyqtSignal(str)
 
-    def __init__(self, model_handler: ModelHandler, image_path: str, top_k: int = 3):
+    def __init__(self, model_handler: ModelHandler, top_k: int = 3, batch_size: int = BATCH_SIZE):
         super().__init__()
         self.model_handler = model_handler
-        self.image_path = image_path
         self.top_k = top_k
+        self.batch_size = batch_size
+        self.in_q = FastQueue()
+        self.results: Dict[int, Tuple[str, List[Tuple[str, float]]]] = {}
+        self._next_slot = itertools.count()
+
+    def submit(self, image_path: str):
+        """Queue an image for prediction."""
+        self.in_q.put(image_path)
+
+    def take_result(self, slot: int) -> Tuple[str, List[Tuple[str, float]]]:
+        """Remove and return the (image_path, predictions) stored in a slot."""
+        return self.results.pop(slot)
+
+    def stop(self):
+        """Finish queued work, then stop the thread."""
+        self.in_q.put(None)
+        self.wait()
 
     def run(self):
-        """Run prediction in separate thread."""
+        """Drain the queue in batches until the stop sentinel arrives.
+        
+        Images already queued behind a batch are decoded on the executor while
+        that batch runs through the model.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            batch = self._start_batch(executor)
+            while True:
+                image_paths, futures, stopping = batch
+                following = None if stopping else self._start_batch(executor, block=False)
+                self._process_batch(image_paths, futures)
+                if stopping:
+                    break
+                batch = following or self._start_batch(executor)
+
+    def _start_batch(self, executor: ThreadPoolExecutor, block: bool = True
+                     ) -> Optional[Tuple[List[str], List[Future], bool]]:
+        """Take the next batch off the queue and submit its preprocessing.
+        
+        Returns the paths, their preprocessing futures and whether the stop
+        sentinel was reached, or None if block is False and the queue is empty.
+        """
+        image_paths = self.in_q.get_batch(self.batch_size, block)
+        if not image_paths:
+            return None
+        stopping = None in image_paths
+        if stopping:
+            image_paths = image_paths[:image_paths.index(None)]
+        futures = [executor.submit(self.model_handler.preprocess_image, path) for path in image_paths]
+        return image_paths, futures, stopping
+
+    def _process_batch(self, image_paths: List[str], futures: List[Future]):
+        """Collect a batch's preprocessed tensors, run one forward pass and emit per-image results."""
+        done = set()
         try:
-            image_tensor = self.model_handler.preprocess_image(self.image_path)
-            if image_tensor is None:
-                raise ValueError("Failed to preprocess image")
-                
-            results = self.model_handler.predict(image_tensor, self.top_k)
-            self.finished.emit(results, self.image_path)
+            tensors, paths = [], []
+            for image_path, future in zip(image_paths, futures):
+                image_tensor = future.result()
+                if image_tensor is None:
+                    self.error.emit(f"Failed to preprocess image {image_path}")
+                    self._publish(image_path, [("Error", 0.0)])
+                    done.add(image_path)
+                    continue
+                tensors.append(image_tensor)
+                paths.append(image_path)
             
+            if tensors:
+                predictions = self.model_handler.predict_batch(tensors, self.top_k)
+                for image_path, results in zip(paths, predictions):
+                    self._publish(image_path, results)
+                    done.add(image_path)
+                    
         except Exception as e:
             logger.error(f"Prediction error: {str(e)}")
             self.error.emit(str(e))
-            self.finished.emit([("Error", 0.0)], self.image_path)
\ No newline at end of file
+            for image_path in image_paths:
+                if image_path not in done:
+                    self._publish(image_path, [("Error", 0.0)])
+
+    def _publish(self, image_path: str, predictions: List[Tuple[str, float]]):
+        """Store a result and signal its slot; the queued signal orders the write before the read."""
+        slot = next(self._next_slot)
+        self.results[slot] = (image_path, predictions)
+        self.prediction_ready.emit(slot)
@@ -12,11 +12,43 @@ from datetime import datetime
 import os
 from PIL import Image as PILImage
 import io
+import functools
 import logging
-from ui_components import DiagnosisData
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Display width of case images in points; rendered at 2x so they stay sharp in print
+IMAGE_WIDTH = 400
+IMAGE_PIXEL_WIDTH = IMAGE_WIDTH * 2
+
+@functools.lru_cache(maxsize=256)
+def _render_thumbnail(image_path: str, width: int, mtime: float) -> Tuple[bytes, float]:
+    """Render an image as JPEG bytes at most `width` pixels wide.
+    
+    Returns the encoded bytes and the height/width aspect ratio. `mtime` is
+    only part of the cache key, so edited files are rendered again.
+    """
+    with PILImage.open(image_path) as img:
+        aspect = img.height / img.width
+        img.thumbnail((width, 10_000), PILImage.Resampling.LANCZOS)
+        img_data = io.BytesIO()
+        img.convert('RGB').save(img_data, format='JPEG', quality=85, optimize=True, progressive=True)
+        return img_data.getvalue(), aspect
+
+def _case_image(image_path: str) -> Tuple[Union[str, bytes], float]:
+    """Get the image source to embed for a case and its aspect ratio.
+    
+    Images already small enough are embedded straight from disk by path;
+    larger ones are downscaled through the thumbnail cache.
+    """
+    with PILImage.open(image_path) as img:  # Parses the header only
+        width, height, image_format = img.width, img.height, img.format
+    if width <= IMAGE_PIXEL_WIDTH and image_format in ('JPEG', 'PNG'):
+        return image_path, height / width
+    return _render_thumbnail(image_path, IMAGE_PIXEL_WIDTH, os.path.getmtime(image_path))
+
 class ReportGenerator:
     """Handles PDF report generation for dental X-ray analysis."""
     
@@ -81,6 +113,8 @@ class ReportGenerator:
                 bottomMargin=72
             )
 
+            self._prefetch_thumbnails(cases)
+            
             story = []
             self._add_header(story)
             
@@ -95,6 +129,21 @@ class ReportGenerator:
             logger.error(f"Failed to generate PDF report: {str(e)}")
             raise
 
+    def _prefetch_thumbnails(self, cases: list):
+        """Read and render case images concurrently to warm the thumbnail cache."""
+        if len(cases) <= 1:
+            return
+            
+        def render(image_path: str):
+            try:
+                _case_image(image_path)
+            except Exception as e:
+                # _add_case reports the failure when it retries this image
+                logger.debug(f"Prefetch failed for {image_path}: {str(e)}")
+        
+        with ThreadPoolExecutor(max_workers=min(len(cases), os.cpu_count() or 1)) as executor:
+            list(executor.map(render, [case['image_path'] for case in cases]))
+
     def _add_header(self, story: list):
         """Add report header."""
         # Add logo and title in a table
@@ -128,16 +177,12 @@ class ReportGenerator:
 
         # Add image
         try:
-            img = PILImage.open(case['image_path'])
-            img_width = 400
-            aspect = img.height / img.width
-            img_height = int(img_width * aspect)
-            
-            img_data = io.BytesIO()
-            img.save(img_data, format='PNG')
-            img_data.seek(0)
+            source, aspect = _case_image(case['image_path'])
+            if isinstance(source, bytes):
+                source = io.BytesIO(source)
+            img_height = int(IMAGE_WIDTH * aspect)
             
-            img_for_pdf = Image(img_data, width=img_width, height=img_height)
+            img_for_pdf = Image(source, width=IMAGE_WIDTH, height=img_height)
             story.append(img_for_pdf)
             story.append(Spacer(1, 20))
             
@@ -168,8 +213,7 @@ class ReportGenerator:
 
         # Add recommendations
         if 'recommendations' in case:
-            self._add_section(story, "Clinical Recommendations", 
-                            [f"{rec[0]} {rec[1]}" for rec in case['recommendations']])
+            self._add_section(story, "Clinical Recommendations", case['recommendations'])
 
     def _add_section(self, story: list, title: str, items: list):
         """Add a section with title and items."""
@@ -180,9 +224,7 @@ class ReportGenerator:
         if data:
             table = Table(data, colWidths=[6.5*inch])
             table.setStyle(TableStyle([
-                ('BACKGROUND', (0, i), (-1, i), colors.HexColor('#f8f9fa') if i % 2 else colors.white)
-                for i in range(len(data))
-            ] + [
+                ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
                 ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
                 ('LEFTPADDING', (0, 0), (-1, -1), 12),
                 ('RIGHTPADDING', (0, 0), (-1, -1), 12),
@@ -194,11 +236,12 @@ class ReportGenerator:
 
 def prepare_case_data(image_card) -> dict:
     """Prepare case data from ImageCard widget."""
+    dx_data = image_card._get_diagnosis_data()
     return {
         'image_path': image_card.image_path,
         'diagnosis': image_card.primary_diagnosis.title(),
         'confidence': image_card.predictions[0][1] * 100,
-        'findings': [f"{item[0]} {item[1]}" for item in image_card._get_findings_for_diagnosis()],
-        'recommendations': image_card._get_recommendations(),
-        'management': DiagnosisData.MANAGEMENT_MAP.get(image_card.primary_diagnosis, {})
+        'findings': dx_data.findings_text,
+        'recommendations': dx_data.recommendations_text,
+        'management': dx_data.management or {}
     }
\ No newline at end of file
@@ -2,31 +2,131 @@
 Complete UI components for the dental X-ray analyzer application.
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                            QLabel, QFrame, QGraphicsDropShadowEffect, 
-                            QGroupBox, QScrollArea)
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QPixmap, QColor
-from typing import List, Tuple, Dict
+from PyQt6 import uic
+from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QPushButton, 
+                            QLabel, QScrollArea)
+from PyQt6.QtCore import (Qt, QEasingCurve, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+from PyQt6.QtGui import QPixmap, QImage, QImageReader
+from collections import OrderedDict
+import functools
+from types import MappingProxyType
+import html
+import os
+import sys
+from typing import List, Tuple, Dict, Optional, Mapping, NamedTuple
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bound formatter for the confidence percentage shown on each card
+_CONF_FMT = "{:.1f}%".format
+
+# Scale factors within this of 1:1 are resampled without smoothing
+NEAR_NATIVE_SCALE = 1.15
+
+# Pre-rendered card background: white rounded card with its drop shadow.
+# The 20px slices are the 8px shadow margin plus the 12px corner radius.
+CARD_SHADOW_IMAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "shadow_9patch.png").replace(os.sep, "/")
+
 class StyleSheet:
-    """Central place for application styling."""
+    """Central place for application styling.
+    
+    All rules are installed once as a single application-wide stylesheet
+    (APPLICATION); widgets opt in through their objectName or a "role"
+    dynamic property instead of parsing a stylesheet of their own.
+    """
+    
+    MAIN_WINDOW = """
+        QMainWindow {
+            background-color: #f5f6fa;
+        }
+    """
+    
+    HEADER = """
+        QLabel[role="logo"] {
+            font-size: 32px;
+        }
+        QLabel[role="title"] {
+            font-size: 32px;
+            font-weight: bold;
+            color: #2c3e50;
+        }
+        QLabel[role="subtitle"] {
+            font-size: 18px;
+            color: #34495e;
+        }
+        QLabel[role="description"] {
+            font-size: 14px;
+            color: #7f8c8d;
+            font-style: italic;
+        }
+    """
+    
+    CONTROL_PANEL = """
+        QWidget[role="controlPanel"] {
+            background-color: #f8f9fa;
+            border-radius: 10px;
+            padding: 15px;
+        }
+    """
+    
+    ACTION_BUTTON = """
+        QPushButton[role="action"] {
+            background-color: #3498db;
+            color: white;
+            border-radius: 8px;
+            padding: 10px;
+            font-size: 14px;
+        }
+        QPushButton[role="action"]:hover {
+            background-color: #2980b9;
+        }
+        QPushButton[role="action"]:pressed {
+            background-color: #2472a4;
+        }
+    """
+    
+    PROGRESS_BAR = """
+        QProgressBar[role="batch"] {
+            border: 2px solid #bdc3c7;
+            border-radius: 5px;
+            text-align: center;
+            height: 25px;
+        }
+        QProgressBar[role="batch"]::chunk {
+            background-color: #3498db;
+            border-radius: 3px;
+        }
+    """
+    
+    CARD_SCROLL_AREA = """
+        QScrollArea[role="cards"] {
+            border: none;
+            background-color: #f5f6fa;
+        }
+    """
     
     CARD_CONTAINER = """
         #cardContainer {
-            background-color: white;
-            border-radius: 12px;
-            border: 1px solid #e0e0e0;
+            border-width: 20px;
+            border-image: url("%s") 20 20 20 20 stretch stretch;
+        }
+    """ % CARD_SHADOW_IMAGE.replace("\\", "\\\\").replace('"', '\\"')
+    
+    IMAGE_FRAME = """
+        QFrame[role="imageFrame"] {
+            background-color: #ffffff;
+            border-radius: 8px;
+            border: 1px solid #e9ecef;
         }
     """
     
     DIAGNOSIS_HEADER = """
-        QLabel {
+        QLabel[role="diagnosisHeader"] {
             color: #2c3e50;
             font-size: 18px;
             font-weight: bold;
@@ -37,23 +137,15 @@ class StyleSheet:
         }
     """
     
-    FINDING_LABEL = """
-        QLabel {
+    FINDING_LIST = """
+        QLabel[role="findingList"] {
             color: #2c3e50;
             font-size: 13px;
-            line-height: 1.6;
-            padding: 8px;
-            background-color: #f8f9fa;
-            border-radius: 6px;
-            margin: 2px 0px;
-        }
-        QLabel:hover {
-            background-color: #e3f2fd;
         }
     """
     
     CONFIDENCE_HEADER = """
-        QLabel {
+        QLabel[role="confidenceHeader"] {
             color: #0066cc;
             font-size: 14px;
             font-weight: bold;
@@ -61,40 +153,35 @@ class StyleSheet:
     """
     
     CONFIDENCE_VALUE = """
-        QLabel {
+        QLabel[role="confidenceValue"] {
             color: #2c3e50;
             font-size: 24px;
             font-weight: bold;
             margin-top: 5px;
         }
     """
-
+    
     GROUP_BOX = """
-        QGroupBox {
+        QGroupBox[role="section"] {
             background-color: #ffffff;
             border-radius: 8px;
             border: 1px solid #e9ecef;
             margin-top: 12px;
             font-weight: bold;
         }
-        QGroupBox::title {
+        QGroupBox[role="section"]::title {
             color: #1976d2;
             padding: 5px 10px;
             background-color: transparent;
             font-size: 14px;
         }
     """
-
-    SECTION_HEADER = """
-        QLabel {
-            color: #2c3e50;
-            font-size: 16px;
-            font-weight: bold;
-            padding: 5px;
-            border-bottom: 2px solid #3498db;
-            margin-bottom: 10px;
-        }
-    """
+    
+    APPLICATION = "".join([
+        MAIN_WINDOW, HEADER, CONTROL_PANEL, ACTION_BUTTON, PROGRESS_BAR,
+        CARD_SCROLL_AREA, CARD_CONTAINER, IMAGE_FRAME, DIAGNOSIS_HEADER,
+        FINDING_LIST, CONFIDENCE_HEADER, CONFIDENCE_VALUE, GROUP_BOX,
+    ])
 
 class DiagnosisData:
     """Contains diagnosis-specific data and recommendations."""
@@ -323,6 +410,218 @@ class DiagnosisData:
         }
     }
 
+    # The maps are constants: freeze them into read-only views over tuples
+    FINDINGS_MAP = MappingProxyType({
+        diagnosis: tuple(items) for diagnosis, items in FINDINGS_MAP.items()
+    })
+
+    RECOMMENDATIONS_MAP = MappingProxyType({
+        diagnosis: tuple(items) for diagnosis, items in RECOMMENDATIONS_MAP.items()
+    })
+
+    MANAGEMENT_MAP = MappingProxyType({
+        diagnosis: MappingProxyType({section: tuple(steps) for section, steps in plan.items()})
+        for diagnosis, plan in MANAGEMENT_MAP.items()
+    })
+
+    # Display strings precomposed once per diagnosis; the non-breaking space
+    # keeps each icon on the same line as its text when labels wrap
+    FINDINGS_TEXT_MAP = MappingProxyType({
+        diagnosis: tuple(sys.intern("\u00a0".join(item)) for item in items)
+        for diagnosis, items in FINDINGS_MAP.items()
+    })
+
+    RECOMMENDATIONS_TEXT_MAP = MappingProxyType({
+        diagnosis: tuple(sys.intern("\u00a0".join(item)) for item in items)
+        for diagnosis, items in RECOMMENDATIONS_MAP.items()
+    })
+
+# A card section's lines as (style role, text) pairs
+SectionItems = Tuple[Tuple[str, str], ...]
+
+# Rich-text templates per line role. QLabel rich text ignores div padding and
+# radii, so each line is a padded table cell on the finding tile colour.
+_SECTION_LINE_HTML = {
+    "finding": '<tr><td bgcolor="#f8f9fa">{}</td></tr>',
+    "sectionHeader": ('<tr><td style="font-size: 16px; font-weight: bold;'
+                      ' color: #2c3e50;">{}</td></tr>'),
+}
+
+def _section_html(items: SectionItems) -> str:
+    """Render a section's lines into one rich-text table."""
+    if not items:
+        return ""
+    rows = "".join(_SECTION_LINE_HTML[role].format(html.escape(text))
+                   for role, text in items)
+    return f'<table width="100%" cellspacing="4" cellpadding="8">{rows}</table>'
+
+class _DiagnosisEntry(NamedTuple):
+    """Everything a card shows for one diagnosis."""
+    management: Optional[Mapping[str, Tuple[str, ...]]]
+    findings_text: Tuple[str, ...]
+    recommendations_text: Tuple[str, ...]
+    findings_html: str
+    management_html: str
+    recommendations_html: str
+
+def _management_items(plan: Optional[Mapping[str, Tuple[str, ...]]]) -> SectionItems:
+    """Flatten a management plan into section headers followed by their steps."""
+    if not plan:
+        return ()
+    return (
+        (("sectionHeader", "🚨 Immediate Action Required:"),)
+        + tuple(("finding", step) for step in plan["Immediate Action"])
+        + (("sectionHeader", "🎯 Long-term Management Plan:"),)
+        + tuple(("finding", step) for step in plan["Long-term Plan"])
+    )
+
+def _diagnosis_entry(diagnosis: str) -> _DiagnosisEntry:
+    """Collect the card data for one diagnosis."""
+    findings_text = DiagnosisData.FINDINGS_TEXT_MAP.get(diagnosis, ())
+    recommendations_text = DiagnosisData.RECOMMENDATIONS_TEXT_MAP.get(diagnosis, ())
+    management = DiagnosisData.MANAGEMENT_MAP.get(diagnosis)
+    return _DiagnosisEntry(
+        management,
+        findings_text,
+        recommendations_text,
+        _section_html(tuple(("finding", text) for text in findings_text)),
+        _section_html(_management_items(management)),
+        _section_html(tuple(("finding", text) for text in recommendations_text)),
+    )
+
+# Per-diagnosis data resolved once at import, keyed by interned diagnosis name
+_DX_CACHE: Dict[str, _DiagnosisEntry] = {
+    sys.intern(diagnosis): _diagnosis_entry(diagnosis)
+    for diagnosis in DiagnosisData.FINDINGS_MAP
+}
+_EMPTY_DX = _diagnosis_entry("unknown")
+
+class ThumbnailCache:
+    """LRU cache of scaled image pixmaps, bounded by their pixel memory.
+    
+    Keys include the file's mtime, so an edited image is decoded again.
+    """
+    
+    MAX_BYTES = 64 * 1024 * 1024
+    
+    _pixmaps: "OrderedDict[Tuple[str, float, int, int], QPixmap]" = OrderedDict()
+    _total_bytes = 0
+    # Thread-pool decodes not yet cached, so each image is decoded only once
+    _in_flight: "Dict[Tuple[str, float, int, int], _ImageLoader]" = {}
+
+    @classmethod
+    def get(cls, path: str, width: int, height: int) -> Optional[QPixmap]:
+        """Get the cached pixmap for an image, or None if it has not been loaded."""
+        key = cls._key(path, width, height)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is not None:
+            cls._pixmaps.move_to_end(key)
+        return pixmap
+
+    @classmethod
+    def put(cls, path: str, width: int, height: int, image: QImage) -> QPixmap:
+        """Convert a scaled image to a pixmap and cache it; call on the GUI thread."""
+        key = cls._key(path, width, height)
+        cached = cls._pixmaps.get(key)
+        if cached is not None:
+            # Another card showing the same image already cached it
+            cls._pixmaps.move_to_end(key)
+            return cached
+        
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            return pixmap
+        
+        cls._pixmaps[key] = pixmap
+        cls._total_bytes += cls._cost(pixmap)
+        while cls._total_bytes > cls.MAX_BYTES and len(cls._pixmaps) > 1:
+            _, evicted = cls._pixmaps.popitem(last=False)
+            cls._total_bytes -= cls._cost(evicted)
+        return pixmap
+
+    @classmethod
+    def load_async(cls, path: str, width: int, height: int, slot) -> None:
+        """Decode an image on the thread pool, cache it and deliver the pixmap to slot.
+        
+        Requests for an image that is already being decoded share that decode.
+        Call on the GUI thread.
+        """
+        key = cls._key(path, width, height)
+        loader = cls._in_flight.get(key)
+        if loader is None:
+            loader = cls._in_flight[key] = _ImageLoader(path, width, height)
+            # Connected before any card, and independent of whether any card survives
+            loader.signals.loaded.connect(functools.partial(cls._on_loaded, key))
+            QThreadPool.globalInstance().start(loader)
+        loader.signals.ready.connect(slot)
+
+    @classmethod
+    def _on_loaded(cls, key: Tuple[str, float, int, int], image: QImage) -> None:
+        """Cache a finished decode and hand the pixmap to the cards waiting on it."""
+        loader = cls._in_flight.pop(key)
+        path, _, width, height = key
+        loader.signals.ready.emit(cls.put(path, width, height, image))
+
+    @staticmethod
+    def load_scaled(path: str, width: int, height: int) -> QImage:
+        """Decode an image scaled to fit width x height; safe off the GUI thread."""
+        reader = QImageReader(path)
+        source_size = reader.size()
+        ratio = (max(source_size.width() / width, source_size.height() / height)
+                 if source_size.isValid() else 1.0)
+        if ratio > NEAR_NATIVE_SCALE:
+            # Let the codec decode straight to the target size (DCT scaling for JPEG)
+            reader.setScaledSize(source_size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+            return reader.read()
+        
+        image = reader.read()
+        if image.isNull():
+            return image
+        # Close to 1:1 nearest-neighbour is visually indistinguishable and far cheaper
+        mode = (Qt.TransformationMode.FastTransformation
+                if ratio * NEAR_NATIVE_SCALE >= 1.0
+                else Qt.TransformationMode.SmoothTransformation)
+        return image.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio, mode)
+
+    @staticmethod
+    def _key(path: str, width: int, height: int) -> Tuple[str, float, int, int]:
+        """Cache key for an image at a given size."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = 0.0
+        return (path, mtime, width, height)
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        """Approximate memory held by a pixmap in bytes."""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+class _ImageLoaderSignals(QObject):
+    """Signals for _ImageLoader; QRunnable itself cannot emit."""
+    
+    loaded = pyqtSignal(QImage)
+    # Re-emitted on the GUI thread once the decoded image is cached
+    ready = pyqtSignal(QPixmap)
+
+class _ImageLoader(QRunnable):
+    """Decodes and scales an image on a QThreadPool thread."""
+    
+    def __init__(self, path: str, width: int, height: int):
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.height = height
+        self.signals = _ImageLoaderSignals()
+
+    def run(self):
+        """Load the image and hand it back to the GUI thread."""
+        self.signals.loaded.emit(ThumbnailCache.load_scaled(self.path, self.width, self.height))
+
+# ImageCard's fixed widget tree, compiled from its Qt Designer file once at import
+_ImageCardForm, _ = uic.loadUiType(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "image_card.ui"))
+
 class ImageCard(QWidget):
     """Widget displaying dental X-ray image with analysis results."""
     
@@ -330,183 +629,73 @@ class ImageCard(QWidget):
         super().__init__()
         self.image_path = image_path
         self.predictions = predictions
-        self.primary_diagnosis = predictions[0][0].lower() if predictions else "unknown"
+        self.primary_diagnosis = sys.intern(predictions[0][0].lower()) if predictions else "unknown"
+        self._dx_data = _DX_CACHE.get(self.primary_diagnosis, _EMPTY_DX)
         self.setup_ui()
 
     def setup_ui(self):
-        """Setup the card UI layout."""
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(15, 15, 15, 15)
-        main_layout.setSpacing(15)
-
-        # Create container with shadow effect
-        container = self._create_container()
-        container_layout = QVBoxLayout(container)
-        container_layout.setContentsMargins(20, 20, 20, 20)
-        container_layout.setSpacing(15)
-
-        # Add components
-        self._add_image_section(container_layout)
-        self._add_diagnosis_section(container_layout)
-        self._add_confidence_section(container_layout)
-        self._add_management_section(container_layout)
-        self._add_recommendations_section(container_layout)
-
-        main_layout.addWidget(container)
-
-    def _create_container(self) -> QFrame:
-        """Create main container with shadow effect."""
-        container = QFrame(self)
-        container.setObjectName("cardContainer")
-        container.setStyleSheet(StyleSheet.CARD_CONTAINER)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 2)
-        container.setGraphicsEffect(shadow)
-        
-        return container
-
-    def _add_image_section(self, layout: QVBoxLayout):
-        """Add image display section."""
-        image_container = QFrame()
-        image_container.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border-radius: 8px;
-                border: 1px solid #e9ecef;
-            }
-        """)
-        
-        image_layout = QVBoxLayout(image_container)
-        image_layout.setContentsMargins(10, 10, 10, 10)
+        """Build the card from its template, then fill in the per-image content."""
+        # Card content as (kind, template section, content[, word wrap]) descriptions
+        confidence_score = self.predictions[0][1] * 100 if self.predictions else 0.0
+        sections = (
+            ("text", "diagnosis_header", f"🔍 Diagnosis: {self.primary_diagnosis.title()}"),
+            ("group", "findings", self._dx_data.findings_html, True),
+            ("text", "confidence_value", _CONF_FMT(confidence_score)),
+            ("group", "management", self._dx_data.management_html, False),
+            ("group", "recommendations", self._dx_data.recommendations_html, False),
+        )
         
+        # Coalesce the layout invalidations from building the tree into one pass
+        self.setUpdatesEnabled(False)
         try:
-            image_label = QLabel()
-            pixmap = QPixmap(self.image_path)
-            scaled_pixmap = pixmap.scaled(
-                400, 400,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            image_label.setPixmap(scaled_pixmap)
-            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            image_layout.addWidget(image_label)
-            layout.addWidget(image_container)
+            self.ui = _ImageCardForm()
+            self.ui.setupUi(self)
+
+            self._add_image_section()
+            builders = {"text": self._set_text, "group": self._fill_group}
+            for kind, *args in sections:
+                builders[kind](*args)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
+
+    def _add_image_section(self):
+        """Show the image, decoding it off the GUI thread on a cache miss."""
+        try:
+            scaled_pixmap = ThumbnailCache.get(self.image_path, 400, 400)
+            if scaled_pixmap is not None:
+                self.ui.image_label.setPixmap(scaled_pixmap)
+            else:
+                # Decode off the GUI thread; the placeholder is replaced once loaded
+                self.ui.image_label.setText("⏳ Loading image...")
+                ThumbnailCache.load_async(self.image_path, 400, 400, self._on_image_loaded)
         except Exception as e:
             logger.error(f"Error loading image {self.image_path}: {str(e)}")
-            error_label = QLabel("Error loading image")
-            image_layout.addWidget(error_label)
-
-    def _add_diagnosis_section(self, layout: QVBoxLayout):
-        """Add diagnosis section with findings."""
-        diagnosis_header = QLabel(f"🔍 Diagnosis: {self.primary_diagnosis.title()}")
-        diagnosis_header.setStyleSheet(StyleSheet.DIAGNOSIS_HEADER)
-        layout.addWidget(diagnosis_header)
-
-        findings_group = self._create_findings_group()
-        layout.addWidget(findings_group)
-
-    def _create_findings_group(self) -> QGroupBox:
-        """Create findings group with items."""
-        group = QGroupBox("📋 Initial Radiographic Assessment")
-        group.setStyleSheet(StyleSheet.GROUP_BOX)
-        
-        layout = QVBoxLayout(group)
-        layout.setContentsMargins(15, 20, 15, 15)
-        
-        findings = self._get_findings_for_diagnosis()
-        for icon, text in findings:
-            finding_label = QLabel(f"{icon} {text}")
-            finding_label.setWordWrap(True)
-            finding_label.setStyleSheet(StyleSheet.FINDING_LABEL)
-            layout.addWidget(finding_label)
-            
-        return group
+            self.ui.image_label.setText("Error loading image")
 
-    def _add_confidence_section(self, layout: QVBoxLayout):
-        """Add confidence score section."""
-        confidence_group = QGroupBox()
-        confidence_layout = QVBoxLayout(confidence_group)
-        confidence_layout.setContentsMargins(15, 15, 15, 15)
-        
-        header = QLabel("🎯 Confidence Score")
-        header.setStyleSheet(StyleSheet.CONFIDENCE_HEADER)
-        
-        confidence_score = self.predictions[0][1] * 100 if self.predictions else 0.0
-        value = QLabel(f"{confidence_score:.1f}%")
-        value.setStyleSheet(StyleSheet.CONFIDENCE_VALUE)
-        
-        confidence_layout.addWidget(header)
-        confidence_layout.addWidget(value)
-        layout.addWidget(confidence_group)
-
-    def _add_management_section(self, layout: QVBoxLayout):
-        """Add management plan section."""
-        management_data = DiagnosisData.MANAGEMENT_MAP.get(self.primary_diagnosis)
-        if not management_data:
-            return
+    def _on_image_loaded(self, pixmap: QPixmap):
+        """Show an image decoded by the thread pool."""
+        if pixmap.isNull():
+            self.ui.image_label.setText("Error loading image")
+        else:
+            self.ui.image_label.setPixmap(pixmap)
 
-        management_group = QGroupBox("📋 Management Plan")
-        management_group.setStyleSheet(StyleSheet.GROUP_BOX)
-        
-        management_layout = QVBoxLayout(management_group)
-        management_layout.setContentsMargins(15, 20, 15, 15)
-        
-        # Immediate Action Section
-        immediate_header = QLabel("🚨 Immediate Action Required:")
-        immediate_header.setStyleSheet(StyleSheet.SECTION_HEADER)
-        management_layout.addWidget(immediate_header)
-        
-        for action in management_data["Immediate Action"]:
-            action_label = QLabel(action)
-            action_label.setStyleSheet(StyleSheet.FINDING_LABEL)
-            management_layout.addWidget(action_label)
-        
-        # Long-term Plan Section
-        longterm_header = QLabel("🎯 Long-term Management Plan:")
-        longterm_header.setStyleSheet(StyleSheet.SECTION_HEADER)
-        management_layout.addWidget(longterm_header)
-        
-        for plan in management_data["Long-term Plan"]:
-            plan_label = QLabel(plan)
-            plan_label.setStyleSheet(StyleSheet.FINDING_LABEL)
-            management_layout.addWidget(plan_label)
-        
-        layout.addWidget(management_group)
-
-    def _add_recommendations_section(self, layout: QVBoxLayout):
-        """Add recommendations section."""
-        recommendations = self._get_recommendations()
-        if recommendations:
-            rec_group = QGroupBox("💡 Clinical Recommendations")
-            rec_group.setStyleSheet(StyleSheet.GROUP_BOX)
-            
-            rec_layout = QVBoxLayout(rec_group)
-            rec_layout.setContentsMargins(15, 20, 15, 15)
+    def _set_text(self, name: str, text: str):
+        """Set the text of a template label."""
+        getattr(self.ui, name).setText(text)
+
+    def _fill_group(self, name: str, content: str, word_wrap: bool):
+        """Add a template group's rich-text label, or hide the group when empty."""
+        if not content:
+            getattr(self.ui, f"{name}_group").hide()
+            return
             
-            for icon, text in recommendations:
-                rec_label = QLabel(f"{icon} {text}")
-                rec_label.setStyleSheet(StyleSheet.FINDING_LABEL)
-                rec_layout.addWidget(rec_label)
-                
-            layout.addWidget(rec_group)
-
-    def _get_findings_for_diagnosis(self) -> List[Tuple[str, str]]:
-        """Get specific findings based on diagnosis."""
-        return DiagnosisData.FINDINGS_MAP.get(self.primary_diagnosis, [])
-
-    def _get_recommendations(self) -> List[Tuple[str, str]]:
-        """Get recommendations based on diagnosis."""
-        return DiagnosisData.RECOMMENDATIONS_MAP.get(self.primary_diagnosis, [])
-
-    def animate_shadow(self, end_blur: int):
-        """Animate container shadow effect."""
-        if hasattr(self, 'container_shadow'):
-            animation = QPropertyAnimation(self.container_shadow, b"blurRadius")
-            animation.setDuration(200)
-            animation.setStartValue(self.container_shadow.blurRadius())
-            animation.setEndValue(end_blur)
-            animation.start()
\ No newline at end of file
+        label = QLabel(content)
+        label.setTextFormat(Qt.TextFormat.RichText)
+        label.setProperty("role", "findingList")
+        label.setWordWrap(word_wrap)
+        getattr(self.ui, f"{name}_layout").addWidget(label)
+
+    def _get_diagnosis_data(self) -> _DiagnosisEntry:
+        """Get the findings, recommendations and management plan for this card's diagnosis."""
+        return self._dx_data